@@ -0,0 +1,51 @@
+"""
+Headless benchmark of the particle system CPU pipeline: update step and vertex data preparation.
+The GPU upload and draw call need a window and are not included.
+Run from the repository root: python -m benchmarks.particles_benchmark
+"""
+import time
+
+from src.engine.particle_system import ParticleSystem
+
+EMITTERS = 8
+CAPACITY = 10_000
+FRAMES = 600
+DT = 1 / 60
+
+
+def run() -> float:
+    system = ParticleSystem(seed=0)
+    for index in range(EMITTERS):
+        # Rate high enough to keep every ring buffer saturated.
+        system.add_emitter(CAPACITY, position=(index * 100.0, 0.0), rate=CAPACITY * 2,
+                           lifetime=(1.0, 2.0), gravity=(0.0, -98.0), drag=0.5)
+
+    # Warm up until the buffers are full.
+    for _ in range(60):
+        system.update(DT)
+
+    particles = 0
+    update_time = prepare_time = 0.0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        system.update(DT)
+        update_time += time.perf_counter() - start
+
+        # What draw() builds before handing the data over to the GPU buffer.
+        start = time.perf_counter()
+        for emitter in system.emitters:
+            particles += len(emitter.vertex_data())
+        prepare_time += time.perf_counter() - start
+
+    update_ms, prepare_ms = update_time * 1000, prepare_time * 1000
+    total_ms = update_ms + prepare_ms
+
+    print(f"{EMITTERS} emitters x {CAPACITY} capacity, {FRAMES} frames")
+    print(f"{particles / FRAMES:.0f} live particles per frame")
+    print(f"update: {update_ms / FRAMES:.3f} ms per frame, vertex data: {prepare_ms / FRAMES:.3f} ms per frame")
+    print(f"{particles / total_ms:.0f} particles per ms (update + vertex data, GPU upload and draw excluded)")
+    return particles / total_ms
+
+
+if __name__ == '__main__':
+    run()
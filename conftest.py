@@ -0,0 +1 @@
+# Puts the repository root on sys.path so that plain `pytest` resolves the `src` imports like main.py does.
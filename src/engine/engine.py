@@ -2,6 +2,7 @@ import arcade
 
 from src.managers.event_manager import *
 from src.managers.input_manager import InputManager
+from src.managers.camera_manager import CameraManager
 from src.engine.state_machine import StateMachine
 from src.viewports.viewport_menu import ViewportMainMenu
 from src.viewports.viewport_game import ViewportMainGame
@@ -24,6 +25,7 @@ class Engine(arcade.Window):
         self.event_manager = event_manager
         self.event_manager.register_listener(self)
         self._input_manager = input_manager
+        self.camera_manager = CameraManager(self.window_size)
 
         # --- INSTANCES ---
         # --- Main Components ---
@@ -0,0 +1,155 @@
+import math
+from typing import Optional
+
+import arcade
+import numpy as np
+from arcade.gl import BufferDescription
+
+from src.managers.camera_manager import CullingCamera
+
+
+class ParticleEmitter(object):
+    """
+    Emits and integrates particles stored in preallocated NumPy arrays.
+    The arrays act as a ring buffer: once the capacity is reached, new particles recycle the oldest slots,
+    so no allocation ever happens after construction.
+    Every emitter is drawn as a single batched submission from a GPU buffer allocated once, on its first draw.
+    """
+
+    def __init__(self, capacity: int, position: tuple = (0.0, 0.0), rate: float = 0.0,
+                 speed: tuple = (50.0, 100.0), angle: tuple = (0.0, 360.0), lifetime: tuple = (0.5, 1.0),
+                 gravity: tuple = (0.0, 0.0), drag: float = 0.0,
+                 color: tuple = arcade.color.WHITE, size: float = 2.0,
+                 rng: Optional[np.random.Generator] = None):
+        # --- Emission Params ---
+        self.position = position
+        # Particles emitted per second. 0 disables continuous emission, burst() can still be used.
+        self.rate = rate
+        self.speed = speed
+        # Angle range in degrees.
+        self.angle = angle
+        self.lifetime = lifetime
+        self.gravity = np.asarray(gravity, dtype=np.float32)
+        # Exponential decay rate of the velocity: a drag of 0.5 removes 1 - exp(-0.5), about 39%, per second.
+        self.drag = drag
+
+        # --- Rendering Params ---
+        self.color = color
+        self.size = size
+
+        # --- Particles Buffers ---
+        self.capacity = capacity
+        self.positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self.ages = np.zeros(capacity, dtype=np.float32)
+        self.lifetimes = np.zeros(capacity, dtype=np.float32)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        # --- GPU Buffers ---
+        # Created on the first draw, the window's OpenGL context being required.
+        self._buffer: Optional[arcade.gl.Buffer] = None
+        self._geometry: Optional[arcade.gl.Geometry] = None
+
+        # --- Ring Buffer ---
+        self._head = 0
+        self._emit_accumulator = 0.0
+        self._rng = rng if rng is not None else np.random.default_rng()
+
+    @property
+    def alive_count(self) -> int:
+        return int(np.count_nonzero(self.alive))
+
+    def burst(self, count: int):
+        """ Spawn count particles at once, overwriting the oldest ones if the buffer is full. """
+        count = min(count, self.capacity)
+        if count <= 0:
+            return
+        indices = (self._head + np.arange(count)) % self.capacity
+        self._head = (self._head + count) % self.capacity
+
+        angles = np.radians(self._rng.uniform(self.angle[0], self.angle[1], count))
+        speeds = self._rng.uniform(self.speed[0], self.speed[1], count)
+
+        self.positions[indices] = self.position
+        self.velocities[indices, 0] = np.cos(angles) * speeds
+        self.velocities[indices, 1] = np.sin(angles) * speeds
+        self.ages[indices] = 0.0
+        self.lifetimes[indices] = self._rng.uniform(self.lifetime[0], self.lifetime[1], count)
+        self.alive[indices] = True
+
+    def update(self, dt: float):
+        """ Continuous emission then integration of every live particle in a single vectorized pass. """
+        if self.rate > 0:
+            self._emit_accumulator += self.rate * dt
+            count = int(self._emit_accumulator)
+            self._emit_accumulator -= count
+            self.burst(count)
+
+        self.ages += dt
+        self.alive &= self.ages < self.lifetimes
+
+        # Dead particles are integrated too: masking would cost more than the extra arithmetic.
+        self.velocities += self.gravity * dt
+        if self.drag > 0:
+            self.velocities *= math.exp(-self.drag * dt)
+        self.positions += self.velocities * dt
+
+    def vertex_data(self) -> np.ndarray:
+        """ Return the live particles positions as a contiguous (N, 2) float32 array, ready to be uploaded. """
+        return self.positions[self.alive]
+
+    def draw(self, camera: Optional[CullingCamera] = None):
+        """ Draw every live particle in one call. Skipped if the camera doesn't overlap the emitter. """
+        points = self.vertex_data()
+        if len(points) == 0:
+            return
+        if camera is not None:
+            mins, maxs = points.min(axis=0), points.max(axis=0)
+            center, extent = (mins + maxs) / 2, (maxs - mins) / 2 + self.size
+            if not camera.is_visible(center[0], center[1], extent[0] * 2, extent[1] * 2):
+                return
+
+        ctx = arcade.get_window().ctx
+        if self._buffer is None:
+            self._buffer = ctx.buffer(reserve=self.capacity * 8, usage='stream')
+            self._geometry = ctx.geometry([BufferDescription(self._buffer, '2f', ['in_vert'])])
+
+        # Same program arcade.draw_points() relies on, without its per-point Python conversion.
+        program = ctx.shape_rectangle_filled_unbuffered_program
+        program['color'] = tuple(channel / 255 for channel in self.color) + ((1.0,) if len(self.color) == 3 else ())
+        program['shape'] = self.size, self.size, 0
+        self._buffer.write(points)
+        self._geometry.render(program, mode=ctx.POINTS, vertices=len(points))
+
+
+class ParticleSystem(object):
+    """
+    Container updating and drawing a group of emitters.
+    Meant to be driven by a viewport: update() on each TickEvent and draw() within viewport_draw().
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.emitters: list[ParticleEmitter] = []
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def alive_count(self) -> int:
+        return sum(emitter.alive_count for emitter in self.emitters)
+
+    def add_emitter(self, capacity: int, **kwargs) -> ParticleEmitter:
+        """ Create and register an emitter sharing the system's random generator. """
+        emitter = ParticleEmitter(capacity, rng=self._rng, **kwargs)
+        self.emitters.append(emitter)
+        return emitter
+
+    def remove_emitter(self, emitter: ParticleEmitter):
+        if emitter in self.emitters:
+            self.emitters.remove(emitter)
+
+    def update(self, dt: float):
+        for emitter in self.emitters:
+            emitter.update(dt)
+
+    def draw(self, camera: Optional[CullingCamera] = None):
+        for emitter in self.emitters:
+            emitter.draw(camera)
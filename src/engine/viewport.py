@@ -4,6 +4,7 @@ from typing import Optional
 
 from src.managers.event_manager import *
 from src.engine.state_machine import StateMachine
+from src.managers.camera_manager import CullingCamera
 
 
 class Viewport(object):
@@ -18,16 +19,29 @@ class Viewport(object):
         self._engine = engine
         self._event_manager = engine.event_manager
         self._event_manager.register_listener(self)
+        self._camera_manager = engine.camera_manager
 
         # --- Cameras ---
-        self._camera = arcade.Camera(self.window_size[0], self.window_size[1])
-        self._camera_gui = arcade.Camera(self.window_size[0], self.window_size[1])
+        # The world camera is only created once the viewport actually needs it.
+        self._world_camera: Optional[CullingCamera] = None
 
         # --- State Machine Params ---
         self._current_state: Optional[StateMachine.State] = None
         # The link state is used to determine whether this a viewport subclass should be in use right now
         self._linked_state: Optional[StateMachine.State] = None
 
+    @property
+    def _camera(self) -> CullingCamera:
+        """ World camera of this viewport, created on first access. """
+        if self._world_camera is None:
+            self._world_camera = self._camera_manager.create_world_camera()
+        return self._world_camera
+
+    @property
+    def _camera_gui(self) -> CullingCamera:
+        """ Full-screen GUI camera, shared by every viewport. """
+        return self._camera_manager.camera_gui
+
     @abc.abstractmethod
     def notify(self, event: Event):
         """
@@ -41,6 +55,8 @@ class Viewport(object):
             self.initialize()
 
         if self._current_state == self._linked_state:
+            if isinstance(event, TickEvent):
+                self.viewport_update(event.dt)
             if isinstance(event, InputEvent):
                 self.viewport_inputs(event)
             if isinstance(event, DrawEvent):
@@ -50,6 +66,9 @@ class Viewport(object):
     def initialize(self):
         pass
 
+    def viewport_update(self, dt: float):
+        pass
+
     @abc.abstractmethod
     def viewport_draw(self):
         arcade.start_render()
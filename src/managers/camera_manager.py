@@ -0,0 +1,65 @@
+from typing import Optional
+
+import arcade
+import numpy as np
+
+
+def aabb_visible(bounds: tuple, centers: np.ndarray, half_sizes: np.ndarray) -> np.ndarray:
+    """
+    Batch AABB test against a (left, bottom, right, top) rectangle.
+    centers is a (N, 2) array of box centers, half_sizes is either a (N, 2) array or a single (2,) extent
+    shared by every box. Returns a (N,) boolean mask, True where the box overlaps the rectangle.
+    """
+    left, bottom, right, top = bounds
+    centers = np.asarray(centers, dtype=np.float32)
+    half_sizes = np.asarray(half_sizes, dtype=np.float32)
+    # Broadcasting allows a single extent for the whole batch.
+    mins = centers - half_sizes
+    maxs = centers + half_sizes
+    return (maxs[..., 0] >= left) & (mins[..., 0] <= right) & (maxs[..., 1] >= bottom) & (mins[..., 1] <= top)
+
+
+class CullingCamera(arcade.Camera):
+    """
+    arcade.Camera exposing its world-space bounds and a visibility query, allowing draw code to skip
+    anything that lies outside of the camera.
+    """
+
+    @property
+    def bounds(self) -> tuple:
+        """ Return the (left, bottom, right, top) world-space rectangle seen by the camera. """
+        x, y = self.position
+        return x, y, x + self.viewport_width * self.scale, y + self.viewport_height * self.scale
+
+    def is_visible(self, x: float, y: float, width: float = 0.0, height: float = 0.0) -> bool:
+        """ Single centered box test. Prefer cull() when there is more than a handful of boxes. """
+        return bool(aabb_visible(self.bounds, (x, y), (width / 2, height / 2)))
+
+    def cull(self, centers: np.ndarray, half_sizes: np.ndarray) -> np.ndarray:
+        """ Returns the boolean mask of the boxes overlapping the camera. See aabb_visible(). """
+        return aabb_visible(self.bounds, centers, half_sizes)
+
+
+class CameraManager(object):
+    """
+    Hands cameras over to the viewports.
+    The full-screen GUI camera never moves, so a single instance is shared by every viewport.
+    World cameras are owned by each viewport and only created the first time they are requested.
+    """
+
+    def __init__(self, window_size: tuple):
+        self.window_size = window_size
+
+        # --- Cameras ---
+        self._camera_gui: Optional[CullingCamera] = None
+
+    @property
+    def camera_gui(self) -> CullingCamera:
+        """ Return the shared GUI camera, created on first use. """
+        if self._camera_gui is None:
+            self._camera_gui = CullingCamera(self.window_size[0], self.window_size[1])
+        return self._camera_gui
+
+    def create_world_camera(self) -> CullingCamera:
+        """ Return a new world camera covering the whole window. """
+        return CullingCamera(self.window_size[0], self.window_size[1])
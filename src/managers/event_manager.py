@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class Event(object):
     """
     A superclass for any events that might be generated bu
@@ -105,6 +108,22 @@ class StateChangeEvent(Event):
             return '%s popped' % self.name
 
 
+class PathFoundEvent(Event):
+    """
+    Posted by the pathfinding manager once a requested path is available. path is None if unreachable.
+    Identical requests are answered together by a single event, at most one per (start, goal) and per tick:
+    listeners must match the results by (start, goal) rather than count them.
+    """
+    def __init__(self, start: tuple, goal: tuple, path: Optional[tuple]):
+        self.name = "Path Found Event"
+        self.start = start
+        self.goal = goal
+        self.path = path
+
+    def __str__(self):
+        return '%s [%s -> %s, length=%s]' % (self.name, self.start, self.goal, len(self.path) if self.path else None)
+
+
 class EventManager(object):
     """
     Coordinate communication between Model, View and Controller
@@ -138,8 +157,8 @@ class EventManager(object):
         It will be broadcast to all listeners.
         """
 
-        # Don't print the redundant Tick Event.
-        if not isinstance(event, TickEvent) and not isinstance(event, DrawEvent):
+        # Don't print the redundant Tick Event, nor the path results which are posted by hundreds.
+        if not isinstance(event, (TickEvent, DrawEvent, PathFoundEvent)):
             print(event)
 
         # Broadcast the event to all subscribed listeners.
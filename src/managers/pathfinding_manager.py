@@ -0,0 +1,252 @@
+import heapq
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from src.managers.event_manager import *
+
+
+def find_path(costs: bytes, width: int, start: tuple, goal: tuple) -> Optional[tuple]:
+    """
+    4-connected A* over a row-major cost grid, as returned by PathGrid.snapshot(). A cost of 0 marks a blocked cell.
+    Returns the path as a tuple of (x, y) cells, start and goal included, or None if the goal can't be reached.
+    Module-level and free of shared state so that it can run on a thread or a process pool.
+    """
+    height = len(costs) // width
+    (sx, sy), (gx, gy) = start, goal
+    if not (0 <= sx < width and 0 <= sy < height and 0 <= gx < width and 0 <= gy < height):
+        return None
+    # Indexing bytes yields plain ints, as fast as a list within the inner loop and cheap to send to a process.
+    start_index, goal_index = sy * width + sx, gy * width + gx
+    if costs[start_index] == 0 or costs[goal_index] == 0:
+        return None
+
+    came_from = {start_index: -1}
+    g_score = {start_index: 0}
+    open_heap = [(abs(sx - gx) + abs(sy - gy), 0, start_index)]
+
+    while open_heap:
+        _, current_g, current = heapq.heappop(open_heap)
+        # Stale entry, the cell was pushed again with a lower cost since.
+        if current_g > g_score[current]:
+            continue
+        if current == goal_index:
+            path = []
+            while current != -1:
+                path.append((current % width, current // width))
+                current = came_from[current]
+            return tuple(reversed(path))
+
+        cx, cy = current % width, current // width
+        for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            neighbour = ny * width + nx
+            cost = costs[neighbour]
+            if cost == 0:
+                continue
+            tentative_g = current_g + cost
+            if tentative_g < g_score.get(neighbour, tentative_g + 1):
+                g_score[neighbour] = tentative_g
+                came_from[neighbour] = current
+                # Every cell costs at least 1, the manhattan distance remains admissible.
+                heapq.heappush(open_heap, (tentative_g + abs(nx - gx) + abs(ny - gy), tentative_g, neighbour))
+    return None
+
+
+class PathGrid(object):
+    """
+    Compact cost grid backed by a uint8 array. 0 is blocked, any other value is the cost of entering the cell.
+    The solvers only ever see an immutable bytes snapshot, re-created lazily after the grid is modified,
+    so that every job of the same grid version shares it.
+    """
+
+    def __init__(self, width: int, height: int, default_cost: int = 1):
+        self.width = width
+        self.height = height
+        self.validate_cost(default_cost)
+        self.cells = np.full((height, width), default_cost, dtype=np.uint8)
+        self._snapshot: Optional[bytes] = None
+
+    @staticmethod
+    def validate_cost(cost: int):
+        if not 0 <= cost <= 255:
+            raise ValueError('Cell cost must be within 0 (blocked) and 255, got %s.' % cost)
+
+    def snapshot(self) -> bytes:
+        if self._snapshot is None:
+            self._snapshot = self.cells.tobytes()
+        return self._snapshot
+
+    def set_region(self, x0: int, y0: int, x1: int, y1: int, cost: int):
+        """ Set the cost of every cell within the inclusive rectangle (x0, y0) - (x1, y1). """
+        self.validate_cost(cost)
+        self.cells[y0:y1 + 1, x0:x1 + 1] = cost
+        self._snapshot = None
+
+
+class PathfindingManager(object):
+    """
+    Solves path requests on a worker pool so that listeners never run A* inline.
+    request_path() can be called from any handler, the result comes back as a PathFoundEvent on a later tick.
+    The default thread pool only keeps the work off the handlers: A* is pure Python and holds the GIL,
+    so the workers still take turns with the frame loop. Pass a ProcessPoolExecutor to solve in parallel.
+    Identical requests share a single job and are answered together, by at most one event per tick.
+    Solved paths are kept in a LRU cache.
+    When set_region() blocks cells or raises their cost, only the paths crossing the region are invalidated.
+    Unblocking cells or lowering their cost may open a shorter route anywhere, so the whole cache is dropped.
+    """
+
+    # Side of the square buckets used to index cached paths by region.
+    BUCKET_SIZE = 16
+
+    def __init__(self, event_manager: EventManager, grid: PathGrid, cache_size: int = 4096,
+                 executor: Optional[Executor] = None):
+        # --- Managers ---
+        self._event_manager = event_manager
+        self._event_manager.register_listener(self)
+
+        # --- Grid ---
+        self.grid = grid
+        # Bumped on each modification, results solved against an older grid are delivered but never cached.
+        self._grid_version = 0
+
+        # --- Workers ---
+        # Any executor can be given, find_path() is picklable for a ProcessPoolExecutor.
+        self._executor = executor if executor is not None else ThreadPoolExecutor(thread_name_prefix='pathfinding')
+        # ((start, goal), grid version at submission) -> future
+        # Keyed by version so that requests made after a grid change never join a job solved on the old grid.
+        self._pending: dict[tuple, Future] = {}
+        # Cache hits, collected on the next tick like the finished jobs. (start, goal) -> path
+        self._ready: dict[tuple, Optional[tuple]] = {}
+        # Results collected during the last tick, posted on the current one. (start, goal) -> path
+        self._outbox: dict[tuple, Optional[tuple]] = {}
+
+        # --- Cache ---
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, Optional[tuple]] = OrderedDict()
+        # bucket (bx, by) -> keys of the cached paths whose bounding box overlaps the bucket
+        self._buckets: dict[tuple, set] = {}
+        self._key_buckets: dict[tuple, list] = {}
+
+    def notify(self, event: Event):
+        if isinstance(event, TickEvent):
+            # Posting what was collected on the previous tick guarantees that no request is answered
+            # within the tick it was made, whatever the order the listeners are notified in.
+            self._post_results()
+            self._collect_results()
+
+        if isinstance(event, QuitEvent):
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def request_path(self, start: tuple, goal: tuple):
+        """ Queue a path request, answered through a PathFoundEvent. """
+        key = (tuple(start), tuple(goal))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self._ready[key] = self._cache[key]
+        elif (key, self._grid_version) not in self._pending:
+            future = self._executor.submit(find_path, self.grid.snapshot(), self.grid.width, key[0], key[1])
+            self._pending[(key, self._grid_version)] = future
+
+    def set_region(self, x0: int, y0: int, x1: int, y1: int, cost: int):
+        """ Modify the grid and drop the cached paths that might no longer be valid or optimal. """
+        self.grid.validate_cost(cost)
+        previous = self.grid.cells[y0:y1 + 1, x0:x1 + 1]
+        # A blocked cell (0) becoming walkable counts as a cost decrease.
+        cheaper = cost != 0 and bool(np.any((previous == 0) | (previous > cost)))
+
+        self.grid.set_region(x0, y0, x1, y1, cost)
+        self._grid_version += 1
+        if cheaper:
+            self._clear_cache()
+        else:
+            for key in self._keys_in_region(x0, y0, x1, y1):
+                self._uncache(key)
+
+    def _post_results(self):
+        outbox, self._outbox = self._outbox, {}
+        for (start, goal), path in outbox.items():
+            self._event_manager.post(PathFoundEvent(start, goal, path))
+
+    def _collect_results(self):
+        self._outbox, self._ready = self._ready, {}
+        # Latest grid version each key was submitted with.
+        latest = {}
+        for key, version in self._pending:
+            latest[key] = max(version, latest.get(key, version))
+
+        answered = {}
+        for (key, version), future in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[(key, version)]
+            # A job submitted on a newer grid answers every requester of this key.
+            if version < latest[key]:
+                continue
+            answered[key] = version
+            try:
+                path = future.result()
+            except Exception as error:
+                # A failed job must not break the tick broadcast, the requesters get an unreachable result.
+                print('Pathfinding %s -> %s failed: %r' % (key[0], key[1], error))
+                self._outbox[key] = None
+                continue
+            if version == self._grid_version:
+                self._cache_path(key, path)
+            self._outbox[key] = path
+
+        # Older jobs of an answered key would only deliver an outdated path after the newer one.
+        for key, version in list(self._pending):
+            if version < answered.get(key, -1):
+                self._pending.pop((key, version)).cancel()
+
+    # region --- Cache ---
+
+    def _bounding_box(self, path: Optional[tuple]) -> tuple:
+        # Unreachable goals depend on the whole grid.
+        if path is None:
+            return 0, 0, self.grid.width - 1, self.grid.height - 1
+        xs, ys = [cell[0] for cell in path], [cell[1] for cell in path]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def _buckets_in_region(self, x0: int, y0: int, x1: int, y1: int) -> list:
+        size = self.BUCKET_SIZE
+        return [(bx, by) for bx in range(x0 // size, x1 // size + 1) for by in range(y0 // size, y1 // size + 1)]
+
+    def _keys_in_region(self, x0: int, y0: int, x1: int, y1: int) -> set:
+        keys = set()
+        for bucket in self._buckets_in_region(x0, y0, x1, y1):
+            keys.update(self._buckets.get(bucket, ()))
+        return keys
+
+    def _cache_path(self, key: tuple, path: Optional[tuple]):
+        self._uncache(key)
+        self._cache[key] = path
+        buckets = self._buckets_in_region(*self._bounding_box(path))
+        self._key_buckets[key] = buckets
+        for bucket in buckets:
+            self._buckets.setdefault(bucket, set()).add(key)
+
+        # Evict the least recently used paths.
+        while len(self._cache) > self.cache_size:
+            self._uncache(next(iter(self._cache)))
+
+    def _clear_cache(self):
+        self._cache.clear()
+        self._buckets.clear()
+        self._key_buckets.clear()
+
+    def _uncache(self, key: tuple):
+        if key not in self._cache:
+            return
+        del self._cache[key]
+        for bucket in self._key_buckets.pop(key):
+            keys = self._buckets[bucket]
+            keys.discard(key)
+            if not keys:
+                del self._buckets[bucket]
+
+    # endregion
@@ -1,9 +1,16 @@
+import os
 from abc import ABC
+from concurrent.futures import ProcessPoolExecutor
 
 import arcade
 
 from src.engine.state_machine import StateMachine
 from src.engine.viewport import Viewport
+from src.engine.particle_system import ParticleSystem
+from src.managers.pathfinding_manager import PathGrid, PathfindingManager
+
+# Side in pixels of a pathfinding grid cell.
+TILE_SIZE = 32
 
 
 class ViewportMainGame(Viewport, ABC):
@@ -12,11 +19,30 @@ class ViewportMainGame(Viewport, ABC):
         # --- Engine's State that allow this viewport to update itself. ---
         self._linked_state = StateMachine.State.MAIN_GAME
 
+        # --- Effects ---
+        self.particles = ParticleSystem()
+
+        # --- Game Logic ---
+        # Solved on worker processes, a thread pool would still share the GIL with the frame loop.
+        # One core is left to the frame loop.
+        self.pathfinding = PathfindingManager(self._event_manager,
+                                              PathGrid(self.window_size[0] // TILE_SIZE,
+                                                       self.window_size[1] // TILE_SIZE),
+                                              executor=ProcessPoolExecutor(max(1, (os.cpu_count() or 2) - 1)))
+
     def initialize(self):
         pass
 
+    def viewport_update(self, dt: float):
+        self.particles.update(dt)
+
     def viewport_draw(self):
         super().viewport_draw()
 
+        # World space effects, culled against the world camera.
+        self._camera.use()
+        self.particles.draw(self._camera)
+
+        self._camera_gui.use()
         arcade.draw_text('GAME', self.window_size[0] // 2, self.window_size[1] // 2,
                          arcade.color.WHITE_SMOKE, 24, anchor_x='center')
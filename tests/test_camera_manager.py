@@ -0,0 +1,47 @@
+import numpy as np
+
+from src.managers.camera_manager import CullingCamera, aabb_visible
+
+BOUNDS = (0.0, 0.0, 100.0, 100.0)
+
+
+def make_camera(x: float, y: float, width: int, height: int, scale: float = 1.0) -> CullingCamera:
+    # arcade.Camera needs a window to be constructed, the culling only relies on these attributes.
+    camera = CullingCamera.__new__(CullingCamera)
+    camera.position = (x, y)
+    camera.viewport_width = width
+    camera.viewport_height = height
+    camera.scale = scale
+    return camera
+
+
+def test_inside_and_outside():
+    centers = np.array([[50, 50], [200, 50], [50, -200]])
+    half_sizes = np.array([[5, 5], [5, 5], [5, 5]])
+    assert aabb_visible(BOUNDS, centers, half_sizes).tolist() == [True, False, False]
+
+
+def test_touching_an_edge_is_visible():
+    centers = np.array([[-5, 50], [50, 105], [-5.5, 50]])
+    assert aabb_visible(BOUNDS, centers, np.array([5, 5])).tolist() == [True, True, False]
+
+
+def test_single_extent_is_broadcast():
+    centers = np.array([[-15, 50], [-25, 50]])
+    assert aabb_visible(BOUNDS, centers, np.array([20, 1])).tolist() == [True, False]
+
+
+def test_empty_batch():
+    mask = aabb_visible(BOUNDS, np.empty((0, 2)), np.array([1, 1]))
+    assert mask.shape == (0,)
+    assert mask.dtype == bool
+
+
+def test_camera_bounds_and_visibility():
+    camera = make_camera(10, 20, 100, 50, scale=2.0)
+    assert camera.bounds == (10, 20, 210, 120)
+
+    assert camera.is_visible(100, 100)
+    assert camera.is_visible(0, 100, width=20)
+    assert not camera.is_visible(0, 100, width=10)
+    assert camera.cull(np.array([[100, 100], [300, 100]]), np.array([1, 1])).tolist() == [True, False]
@@ -0,0 +1,49 @@
+import numpy as np
+
+from src.engine.particle_system import ParticleEmitter
+
+
+def make_emitter(capacity: int, **kwargs) -> ParticleEmitter:
+    return ParticleEmitter(capacity, lifetime=(10.0, 10.0), rng=np.random.default_rng(0), **kwargs)
+
+
+def test_burst_wraps_around_and_recycles_oldest():
+    emitter = make_emitter(8)
+    emitter.burst(6)
+    emitter.update(1.0)
+    # The next burst spans the end of the buffer: slots 6, 7 then 0, 1 are (re)used.
+    emitter.burst(4)
+
+    assert emitter.alive_count == 8
+    assert emitter._head == 2
+    assert emitter.ages.tolist() == [0, 0, 1, 1, 1, 1, 0, 0]
+
+
+def test_burst_larger_than_capacity_is_clamped():
+    emitter = make_emitter(4)
+    emitter.burst(10)
+    assert emitter.alive_count == 4
+    assert emitter._head == 0
+
+
+def test_particles_die_after_their_lifetime():
+    emitter = ParticleEmitter(4, lifetime=(1.0, 1.0), rng=np.random.default_rng(0))
+    emitter.burst(4)
+    emitter.update(0.5)
+    assert emitter.alive_count == 4
+    emitter.update(0.6)
+    assert emitter.alive_count == 0
+    assert len(emitter.vertex_data()) == 0
+
+
+def test_emission_accumulator_carries_fractions():
+    # 2.5 particles per frame: 2, 3, 2, 3...
+    emitter = make_emitter(100, rate=150.0)
+    counts = []
+    for _ in range(4):
+        before = emitter.alive_count
+        emitter.update(1 / 60)
+        counts.append(emitter.alive_count - before)
+
+    assert counts == [2, 3, 2, 3]
+    assert emitter.alive_count == 10
@@ -0,0 +1,142 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.managers.event_manager import *
+from src.managers.pathfinding_manager import PathGrid, PathfindingManager
+
+
+class PathListener(object):
+    def __init__(self, event_manager: EventManager):
+        self.events = []
+        event_manager.register_listener(self)
+
+    def notify(self, event: Event):
+        if isinstance(event, PathFoundEvent):
+            self.events.append(event)
+
+
+def tick_until(event_manager: EventManager, condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        event_manager.post(TickEvent(0.016))
+        time.sleep(0.005)
+
+
+def test_request_after_grid_change_does_not_join_stale_job():
+    event_manager = EventManager()
+    listener = PathListener(event_manager)
+    manager = PathfindingManager(event_manager, PathGrid(200, 200))
+
+    manager.request_path((0, 0), (199, 199))
+    # Wall off the start column while the first job is still pending.
+    manager.set_region(1, 0, 1, 199, 0)
+    manager.request_path((0, 0), (199, 199))
+
+    tick_until(event_manager, lambda: listener.events and listener.events[-1].path is None)
+    # The job solved on the old grid must never be answered after the up to date one.
+    tick_until(event_manager, lambda: False, timeout=0.3)
+    event_manager.post(QuitEvent())
+
+    assert listener.events[-1].path is None
+
+
+def test_cache_hit_is_answered_on_a_later_tick():
+    event_manager = EventManager()
+    listener = PathListener(event_manager)
+    manager = PathfindingManager(event_manager, PathGrid(16, 16))
+
+    manager.request_path((0, 0), (15, 15))
+    tick_until(event_manager, lambda: len(listener.events) >= 1)
+    listener.events.clear()
+
+    # The cache hit is requested before the manager handles this tick.
+    manager.request_path((0, 0), (15, 15))
+    event_manager.post(TickEvent(0.016))
+    assert listener.events == []
+    event_manager.post(TickEvent(0.016))
+    event_manager.post(QuitEvent())
+    assert len(listener.events) == 1
+
+
+def test_failed_job_posts_unreachable_path():
+    event_manager = EventManager()
+    listener = PathListener(event_manager)
+    manager = PathfindingManager(event_manager, PathGrid(16, 16))
+
+    # A malformed request makes the worker raise.
+    manager.request_path((0, 0, 0), (15, 15))
+    tick_until(event_manager, lambda: len(listener.events) >= 1)
+    event_manager.post(QuitEvent())
+
+    assert len(listener.events) == 1
+    assert listener.events[0].path is None
+
+
+def test_lowering_cost_outside_path_invalidates_cache():
+    event_manager = EventManager()
+    listener = PathListener(event_manager)
+    grid = PathGrid(64, 64, default_cost=20)
+    manager = PathfindingManager(event_manager, grid)
+
+    # Cheap side columns, the expensive top row still makes the direct path the shortest.
+    grid.set_region(0, 1, 0, 39, 1)
+    grid.set_region(10, 1, 10, 39, 1)
+    manager.request_path((0, 0), (10, 0))
+    tick_until(event_manager, lambda: len(listener.events) >= 1)
+    # Lowering the top row, far from the cached path's bounding box, opens a cheaper route.
+    manager.set_region(0, 40, 10, 63, 1)
+    manager.request_path((0, 0), (10, 0))
+    tick_until(event_manager, lambda: len(listener.events) >= 2)
+    event_manager.post(QuitEvent())
+
+    assert len(listener.events) == 2
+    assert listener.events[1].path != listener.events[0].path
+
+
+def test_solves_on_a_process_pool():
+    event_manager = EventManager()
+    listener = PathListener(event_manager)
+    manager = PathfindingManager(event_manager, PathGrid(32, 32), executor=ProcessPoolExecutor(2))
+
+    manager.set_region(5, 0, 5, 30, 0)
+    manager.request_path((0, 0), (10, 0))
+    tick_until(event_manager, lambda: len(listener.events) >= 1, timeout=30.0)
+    event_manager.post(QuitEvent())
+
+    assert len(listener.events) == 1
+    assert (5, 31) in listener.events[0].path
+
+
+def test_identical_requests_get_one_event_per_tick():
+    event_manager = EventManager()
+    listener = PathListener(event_manager)
+    manager = PathfindingManager(event_manager, PathGrid(32, 32))
+
+    goals = [(x, 31) for x in range(24)]
+    manager.request_path((0, 0), goals[0])
+    tick_until(event_manager, lambda: len(listener.events) >= 1)
+    listener.events.clear()
+
+    # A mix of a cache hit and in-flight jobs, each requested several times.
+    for index in range(200):
+        manager.request_path((0, 0), goals[index % len(goals)])
+    tick_until(event_manager, lambda: len(listener.events) >= len(goals))
+    tick_until(event_manager, lambda: False, timeout=0.1)
+    event_manager.post(QuitEvent())
+
+    assert sorted(event.goal for event in listener.events) == goals
+
+
+def test_cost_out_of_range_raises_value_error():
+    event_manager = EventManager()
+    manager = PathfindingManager(event_manager, PathGrid(8, 8))
+
+    with pytest.raises(ValueError):
+        manager.set_region(0, 0, 1, 1, 256)
+    with pytest.raises(ValueError):
+        manager.grid.set_region(0, 0, 1, 1, -1)
+    with pytest.raises(ValueError):
+        PathGrid(8, 8, default_cost=300)
+    event_manager.post(QuitEvent())